@@ -1,12 +1,37 @@
 import sys
+from functools import partial
 from PyQt6.QtWidgets import QApplication, QMainWindow, QTabWidget, QWidget, QVBoxLayout
 from PyQt6.QtGui import QIcon, QPalette, QColor
 from PyQt6.QtCore import Qt
+from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from tts_tab import TTSTab
 from yt_tab import YouTubeTab
 from converter_tab import ImageConverterTab
 
 
+class AudioService:
+    """One QMediaPlayer/QAudioOutput pair shared by every tab that plays audio.
+
+    The backend is only initialised when a tab first asks for the player.
+    """
+
+    def __init__(self):
+        self._player = None
+        self._output = None
+
+    @property
+    def player(self):
+        if self._player is None:
+            self._output = QAudioOutput()
+            self._player = QMediaPlayer()
+            self._player.setAudioOutput(self._output)
+        return self._player
+
+    @property
+    def output(self):
+        return self.player.audioOutput()
+
+
 class MainApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -14,13 +39,22 @@ class MainApp(QMainWindow):
         self.setGeometry(200, 100, 950, 600)
         self.setWindowIcon(QIcon.fromTheme("multimedia-player"))
 
-        # Tabs
-        tabs = QTabWidget()
-        tabs.addTab(TTSTab(), "🗣️ Text-to-Speech")
-        tabs.addTab(YouTubeTab(), "📺 YouTube Downloader")
-        tabs.addTab(ImageConverterTab(), "⛏ Converter")
+        self.audio = AudioService()
+
+        # Tabs are built on first visit, so startup only pays for the visible one
+        self._tab_factories = [
+            (partial(TTSTab, audio=self.audio), "🗣️ Text-to-Speech"),
+            (YouTubeTab, "📺 YouTube Downloader"),
+            (ImageConverterTab, "⛏ Converter"),
+        ]
+        self._tabs = {}
+        self.tabs = QTabWidget()
+        for _, label in self._tab_factories:
+            self.tabs.addTab(QWidget(), label)
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(self.tabs.currentIndex())
 
-        tabs.setStyleSheet("""
+        self.tabs.setStyleSheet("""
             QTabWidget::pane {
                 border: 1px solid #444;
                 border-radius: 8px;
@@ -45,11 +79,28 @@ class MainApp(QMainWindow):
         """)
 
         layout = QVBoxLayout()
-        layout.addWidget(tabs)
+        layout.addWidget(self.tabs)
         container = QWidget()
         container.setLayout(layout)
         self.setCentralWidget(container)
 
+    def _ensure_tab(self, index):
+        """Swap the placeholder at index for the real tab the first time it is shown."""
+        if index < 0 or index in self._tabs:
+            return
+        factory, label = self._tab_factories[index]
+        tab = factory()
+        self._tabs[index] = tab
+
+        placeholder = self.tabs.widget(index)
+        # removeTab/insertTab move the current index around, don't recurse into here
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, label)
+        self.tabs.setCurrentIndex(index)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
 
 def apply_modern_style(app: QApplication):
     """Apply a beautiful dark modern theme."""
@@ -1,21 +1,239 @@
 import os
-from PIL import Image
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import PIL
+from PIL import Image, features
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QTextEdit, QFileDialog, QSlider, QMessageBox, QComboBox
+    QLineEdit, QTextEdit, QFileDialog, QSlider, QMessageBox, QComboBox, QCheckBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QTextCursor
+
+try:
+    # optional: libvips streams images through in strips and is faster than Pillow
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
 
 
 SUPPORTED_FORMATS = [
     "PNG", "WEBP", "JPEG", "GIF", "TIFF", "BMP", "PDF"
 ]
 
+# file extension -> Pillow format name
+EXT_TO_PIL = {
+    "png": "PNG", "webp": "WEBP", "jpeg": "JPEG", "jpg": "JPEG", "gif": "GIF",
+    "tiff": "TIFF", "tif": "TIFF", "bmp": "BMP", "pdf": "PDF",
+}
+
+# format -> every filename suffix it is stored under
+IN_SUFFIXES = {
+    fmt: tuple(f".{ext}" for ext, pil_fmt in EXT_TO_PIL.items() if pil_fmt == fmt)
+    for fmt in SUPPORTED_FORMATS
+}
+
+JPEG_EXTS = frozenset({"jpeg", "jpg"})
+LOSSY_EXTS = JPEG_EXTS | {"webp"}
+# formats libvips reads and writes without ImageMagick, the rest always go through Pillow
+VIPS_EXTS = LOSSY_EXTS | {"png", "tiff", "tif"}
+
+
+def pillow_build_info():
+    """Describe the Pillow build used for conversion (Pillow-SIMD tags its versions with .postN)."""
+    if ".post" in PIL.__version__:
+        return f"Pillow-SIMD {PIL.__version__} (SIMD enabled)"
+    return f"Pillow {PIL.__version__} (no SIMD, install pillow-simd for faster conversion)"
+
+
+def codec_warnings():
+    """List the SIMD codec libraries Pillow was not built against."""
+    warnings = []
+    try:
+        if not features.check_feature("libjpeg_turbo"):
+            warnings.append("Pillow is not linked against libjpeg-turbo, JPEG conversion will be slow.")
+    except ValueError:
+        # Pillow too old to report the JPEG library
+        warnings.append("Cannot detect libjpeg-turbo, consider upgrading Pillow.")
+    if not features.check_module("webp"):
+        warnings.append("Pillow was built without libwebp, WEBP conversion is unavailable.")
+    return warnings
+
+
+def build_save_kwargs(out_fmt, quality, method, optimize):
+    """Encoder options for Image.save, identical for every file in a batch."""
+    save_kwargs = {}
+    if out_fmt in LOSSY_EXTS:
+        save_kwargs["quality"] = quality
+    if out_fmt == "webp":
+        save_kwargs["method"] = method
+        # quality 100 means "keep everything", which only lossless WEBP does
+        save_kwargs["lossless"] = quality == 100
+    elif out_fmt in JPEG_EXTS and optimize:
+        # optimal Huffman tables cost an extra pass but shave a few % off every file
+        save_kwargs.update(optimize=True, progressive=True, subsampling="4:2:0")
+    return save_kwargs
+
+
+def build_vips_kwargs(out_fmt, quality, method, optimize):
+    """Saver options for pyvips write_to_file, mirroring build_save_kwargs."""
+    vips_kwargs = {"strip": True}
+    if out_fmt in LOSSY_EXTS:
+        vips_kwargs["Q"] = quality
+    if out_fmt == "webp":
+        # libvips renamed reduction_effort to effort in 8.12
+        effort_key = "effort" if pyvips.at_least_libvips(8, 12) else "reduction_effort"
+        vips_kwargs[effort_key] = method
+        vips_kwargs["lossless"] = quality == 100
+    elif out_fmt in JPEG_EXTS and optimize:
+        vips_kwargs.update(optimize_coding=True, interlace=True)
+    return vips_kwargs
+
+
+def _convert_one(filename, in_fmt, out_fmt, pil_fmt, save_kwargs, vips_kwargs, input_prefix, output_prefix):
+    """Convert a single image, returning (ok, log message). vips_kwargs=None selects Pillow.
+
+    The prefixes are folder paths ending in a separator, so paths are plain concatenation.
+    """
+    input_path = input_prefix + filename
+    output_name = filename.rpartition(".")[0] + "." + out_fmt
+    output_path = output_prefix + output_name
+
+    try:
+        if in_fmt == out_fmt and out_fmt not in LOSSY_EXTS:
+            # lossless format with no encoder options: copy the file byte-for-byte, so alpha,
+            # palettes, 16-bit samples and animation frames are kept rather than flattened to RGB
+            if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+                return True, f"Unchanged: {filename} (already {pil_fmt})"
+            shutil.copyfile(input_path, output_path)
+        elif vips_kwargs is not None:
+            # sequential access decodes on demand, peak memory stays at a few scanlines
+            image = pyvips.Image.new_from_file(input_path, access="sequential")
+            # same output as Pillow's convert("RGB"): 8-bit sRGB, alpha dropped
+            image = image.colourspace("srgb")
+            if image.hasalpha():
+                image = image.extract_band(0, n=image.bands - 1)
+            if image.format != "uchar":
+                image = image.cast("uchar")
+            if os.path.exists(output_path) and os.path.samefile(input_path, output_path):
+                # the input is still being read while the output is written, never truncate it
+                # in place; the temp name keeps the extension so vips picks the same saver
+                tmp_path = output_prefix + ".~" + output_name
+                try:
+                    image.write_to_file(tmp_path, **vips_kwargs)
+                    os.replace(tmp_path, output_path)
+                except Exception:
+                    if os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    raise
+            else:
+                image.write_to_file(output_path, **vips_kwargs)
+        else:
+            with Image.open(input_path) as img:
+                if img.mode != "RGB":
+                    img = img.convert("RGB")
+                img.save(output_path, pil_fmt, **save_kwargs)
+
+        size_kb = os.stat(output_path).st_size // 1024
+        return True, f"Converted: {filename} → {output_name} ({size_kb} KB)"
+    except Exception as e:
+        return False, f"Failed: {filename} ({str(e)})"
+
+
+# ---------- Worker thread ----------
+
+class ConvertWorker(threading.Thread):
+    """Converts a folder on a thread pool; Pillow and libvips release the GIL while coding images."""
+
+    def __init__(self, input_folder, output_folder, in_fmt, out_fmt, quality, method, optimize, backend,
+                 progress_signal):
+        super().__init__(daemon=True)
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.in_fmt = in_fmt
+        self.out_fmt = out_fmt
+        self.quality = quality
+        self.method = method
+        self.optimize = optimize
+        self.backend = backend
+        self.progress_signal = progress_signal
+        # log lines not yet picked up by the UI, see take_lines()
+        self._log_lock = threading.Lock()
+        self._pending_lines = []
+
+    def run(self):
+        count = 0
+        try:
+            suffixes = IN_SUFFIXES[self.in_fmt.upper()]
+            # scandir hands back the file type with the entry, no extra stat per file
+            with os.scandir(self.input_folder) as it:
+                filenames = sorted(e.name for e in it if e.is_file() and e.name.lower().endswith(suffixes))
+            # a.jpg and a.jpeg would both be written to a.<out_fmt> at the same time, keep the first
+            stems = set()
+            unique = []
+            for name in filenames:
+                stem = name.rpartition(".")[0]
+                if stem in stems:
+                    self._log(f"Skipped: {name} (another file also converts to {stem}.{self.out_fmt})")
+                else:
+                    stems.add(stem)
+                    unique.append(name)
+            filenames = unique
+            vips_kwargs = None
+            if self.backend == "pyvips" and self.in_fmt in VIPS_EXTS and self.out_fmt in VIPS_EXTS:
+                vips_kwargs = build_vips_kwargs(self.out_fmt, self.quality, self.method, self.optimize)
+            job = partial(
+                _convert_one,
+                in_fmt=self.in_fmt,
+                out_fmt=self.out_fmt,
+                pil_fmt=EXT_TO_PIL[self.out_fmt],
+                save_kwargs=build_save_kwargs(self.out_fmt, self.quality, self.method, self.optimize),
+                vips_kwargs=vips_kwargs,
+                input_prefix=os.path.join(self.input_folder, ""),
+                output_prefix=os.path.join(self.output_folder, ""),
+            )
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+                for ok, msg in ex.map(job, filenames):
+                    self._log(msg)
+                    count += ok
+        except Exception as e:
+            self._log(f"Failed: {e}")
+        self.progress_signal.emit("done", count)
+
+    def _log(self, msg):
+        with self._log_lock:
+            in_flight = bool(self._pending_lines)
+            self._pending_lines.append(msg)
+        if not in_flight:
+            # the UI takes every line queued up by the time it gets to this message
+            self.progress_signal.emit("log", self)
+
+    def take_lines(self):
+        """Log lines since the last call. Called from the UI thread."""
+        with self._log_lock:
+            lines, self._pending_lines = self._pending_lines, []
+        return lines
+
 
 class ImageConverterTab(QWidget):
+    # emitted from ConvertWorker, delivered on the UI thread
+    worker_message = pyqtSignal(str, object)
+
     def __init__(self):
         super().__init__()
+        self.worker = None
+        # prefer libvips when it's installed, Pillow handles everything else
+        self._backend = "pyvips" if pyvips is not None else "pillow"
         self.init_ui()
+        if self._backend == "pyvips":
+            self.log_box.append(f"Image backend: libvips {pyvips.version(0)}.{pyvips.version(1)} (Pillow fallback)")
+        self.log_box.append(f"Image backend: {pillow_build_info()}")
+        for warning in codec_warnings():
+            self.log_box.append(f"Warning: {warning}")
+
+        self.worker_message.connect(self._handle_message, Qt.ConnectionType.QueuedConnection)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -101,9 +319,14 @@ class ImageConverterTab(QWidget):
         m_layout.addWidget(self.method_label)
         layout.addLayout(m_layout)
 
+        # JPEG encoder options
+        self.optimize_check = QCheckBox("Optimize JPEG (progressive, optimized Huffman tables)")
+        self.optimize_check.setChecked(True)
+        layout.addWidget(self.optimize_check)
+
         # Convert button
-        convert_btn = QPushButton("Convert")
-        convert_btn.setStyleSheet("""
+        self.convert_btn = QPushButton("Convert")
+        self.convert_btn.setStyleSheet("""
             QPushButton {
                 background-color: #4CAF50;
                 color: white;
@@ -115,8 +338,8 @@ class ImageConverterTab(QWidget):
                 background-color: #45a049;
             }
         """)
-        convert_btn.clicked.connect(self.convert)
-        layout.addWidget(convert_btn)
+        self.convert_btn.clicked.connect(self.convert)
+        layout.addWidget(self.convert_btn)
 
         # Output log box
         layout.addWidget(QLabel("Conversion Log:"))
@@ -162,39 +385,48 @@ class ImageConverterTab(QWidget):
             return
 
         os.makedirs(output_folder, exist_ok=True)
-        quality = self.quality_slider.value()
-        method = self.method_slider.value()
-
-        count = 0
         self.log_box.clear()
-
-        for filename in os.listdir(input_folder):
-            if not filename.lower().endswith(f".{in_fmt}"):
-                continue
-
-            input_path = os.path.join(input_folder, filename)
-            output_path = os.path.join(output_folder, os.path.splitext(filename)[0] + f".{out_fmt}")
-
-            try:
-                with Image.open(input_path) as img:
-                    img = img.convert("RGB")
-
-                    save_kwargs = {}
-                    if out_fmt in ["webp", "jpeg", "jpg"]:
-                        save_kwargs["quality"] = quality
-                    if out_fmt == "webp":
-                        save_kwargs["method"] = method
-
-                    img.save(output_path, out_fmt.upper(), **save_kwargs)
-
-                    size_kb = os.path.getsize(output_path) // 1024
-                    self.log_box.append(f"Converted: {filename} → {os.path.basename(output_path)} ({size_kb} KB)")
-                    count += 1
-
-            except Exception as e:
-                self.log_box.append(f"Failed: {filename} ({str(e)})")
-
-        if count == 0:
-            QMessageBox.information(self, "No Files", "No files found for conversion.")
-        else:
-            QMessageBox.information(self, "Done", f"Converted {count} files.")
+        self.convert_btn.setEnabled(False)
+
+        self.worker = ConvertWorker(
+            input_folder=input_folder,
+            output_folder=output_folder,
+            in_fmt=in_fmt,
+            out_fmt=out_fmt,
+            quality=self.quality_slider.value(),
+            method=self.method_slider.value(),
+            optimize=self.optimize_check.isChecked(),
+            backend=self._backend,
+            progress_signal=self.worker_message
+        )
+        self.worker.start()
+
+    def _handle_message(self, typ, data):
+        if typ == "log":
+            # data is the worker; lines that arrived meanwhile were batched, draw them in one go
+            lines = data.take_lines()
+            if lines:
+                self._append_log(lines)
+        elif typ == "done":
+            self.convert_btn.setEnabled(True)
+            if data == 0:
+                QMessageBox.information(self, "No Files", "No files found for conversion.")
+            else:
+                QMessageBox.information(self, "Done", f"Converted {data} files.")
+
+    def _append_log(self, lines):
+        """Append several log lines with a single layout pass instead of one per line."""
+        doc = self.log_box.document()
+        cursor = QTextCursor(doc)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        prefix = "" if doc.isEmpty() else "\n"
+        # follow the tail like append() does, unless the user scrolled up to read
+        sb = self.log_box.verticalScrollBar()
+        at_bottom = sb.value() == sb.maximum()
+        self.log_box.setUpdatesEnabled(False)
+        try:
+            cursor.insertText(prefix + "\n".join(lines))
+        finally:
+            self.log_box.setUpdatesEnabled(True)
+        if at_bottom:
+            sb.setValue(sb.maximum())
@@ -2,32 +2,99 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QTextEdit, QComboBox, QFileDialog, QMessageBox, QSlider,
 )
-from PyQt6.QtCore import Qt, QUrl, QTimer, QBuffer
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+from PyQt6.QtCore import Qt, QUrl, QBuffer, QByteArray, pyqtSignal
+from PyQt6.QtMultimedia import QMediaPlayer
 from pathlib import Path
+from functools import lru_cache, partial
 import asyncio
+import json
+import threading
+import time
 import pyttsx3
 import edge_tts
-from pydub import AudioSegment
-import io, tempfile
+import subprocess
+import tempfile
 
 
 def format_time(milliseconds):
     """Convert milliseconds to MM:SS format"""
-    seconds = milliseconds // 1000
-    minutes = seconds // 60
-    seconds = seconds % 60
+    return _format_seconds(milliseconds // 1000)
+
+
+@lru_cache(maxsize=1024)
+def _format_seconds(total_seconds):
+    # position updates arrive several times a second, only format each second once
+    minutes, seconds = divmod(total_seconds, 60)
     return f"{minutes}:{seconds:02d}"
 
 
+def _transcode(src, dst):
+    """Re-encode an audio file with ffmpeg, the output format follows dst's extension."""
+    result = subprocess.run(
+        ["ffmpeg", "-hide_banner", "-loglevel", "error", "-y", "-i", str(src), str(dst)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        # the last few lines say why, the rest is usually stream info
+        tail = "\n".join(result.stderr.decode(errors="replace").strip().splitlines()[-5:])
+        raise RuntimeError(f"ffmpeg failed ({result.returncode}): {tail}")
+
+
+VOICES_CACHE = Path.home() / ".cache" / "media-utility" / "voices.json"
+VOICES_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+async def load_edge_voices():
+    """Edge voice names, from the disk cache when it's fresh, otherwise from the service."""
+    try:
+        if time.time() - VOICES_CACHE.stat().st_mtime < VOICES_CACHE_TTL:
+            return json.loads(VOICES_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        pass  # missing or corrupt cache, fetch a fresh list
+
+    voices = await edge_tts.list_voices()
+    names = sorted(v["ShortName"] for v in voices)
+    try:
+        VOICES_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        VOICES_CACHE.write_text(json.dumps(names), encoding="utf-8")
+    except OSError:
+        pass  # caching is best-effort
+    return names
+
+
 class TTSTab(QWidget):
-    def __init__(self):
+    # emitted from the event loop thread, delivered on the UI thread
+    synth_finished = pyqtSignal(str)
+    synth_failed = pyqtSignal(str)
+    voices_loaded = pyqtSignal(list)
+
+    def __init__(self, audio):
         super().__init__()
+        # shared AudioService, the player is owned by the main window
+        self.audio = audio
         self.media_player = None
         self.audio_output = None
+        self._player_connected = False
         self.is_playing = False
+        self._duration = 0
+        # pyttsx3 driver and scratch dir, created on first use and kept for the session;
+        # TemporaryDirectory removes itself when the tab goes away or the interpreter exits
+        self._pyttsx3 = None
+        self._tmp_dir = None
+        self._tmp_wav = None
         self.init_ui()
 
+        # one long-lived event loop for all edge-tts calls instead of asyncio.run() per click
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="edge-tts", daemon=True).start()
+
+        self.synth_finished.connect(self.on_synth_finished)
+        self.synth_failed.connect(self.on_synth_failed)
+        self.voices_loaded.connect(self.on_voices_loaded)
+
+        # the built-in voices stay usable until the full list arrives
+        asyncio.run_coroutine_threadsafe(load_edge_voices(), self._loop).add_done_callback(self._on_voices_done)
+
     def init_ui(self):
         layout = QVBoxLayout()
 
@@ -54,8 +121,8 @@ class TTSTab(QWidget):
         browse_btn.clicked.connect(self.browse_file)
 
         # Convert button
-        convert_btn = QPushButton("Convert")
-        convert_btn.clicked.connect(self.convert)
+        self.convert_btn = QPushButton("Convert")
+        self.convert_btn.clicked.connect(self.convert)
 
         # Modern YouTube-style Player UI
         player_container = QHBoxLayout()
@@ -138,26 +205,50 @@ class TTSTab(QWidget):
         out_layout.addWidget(browse_btn)
         layout.addLayout(out_layout)
 
-        layout.addWidget(convert_btn)
+        layout.addWidget(self.convert_btn)
         layout.addWidget(QLabel("Preview:"))
         layout.addLayout(player_container)
 
         self.setLayout(layout)
 
         # Setup media player
-        self.media_player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.media_player.setAudioOutput(self.audio_output)
+        self.media_player = self.audio.player
+        self.audio_output = self.audio.output
 
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.update_player_ui)
         self.play_stop_btn.clicked.connect(self.toggle_play_stop)
-        self.slider.sliderPressed.connect(self.on_slider_pressed)
         self.slider.sliderReleased.connect(self.on_slider_released)
         self.slider.sliderMoved.connect(self.on_slider_moved)
 
-        # Connect media player signals
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._connect_player()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._disconnect_player()
+
+    def _connect_player(self):
+        """Listen to the shared player while this tab is visible"""
+        if self._player_connected:
+            return
+        # Connect media player signals (the player only emits these while something changes)
         self.media_player.playbackStateChanged.connect(self.on_playback_state_changed)
+        self.media_player.positionChanged.connect(self.on_position_changed)
+        self.media_player.durationChanged.connect(self.on_duration_changed)
+        self._player_connected = True
+
+        # catch up on anything that happened while the tab was hidden
+        self._duration = self.media_player.duration()
+        self.is_playing = self.media_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+        self.play_stop_btn.setText("⏹" if self.is_playing else "▶")
+
+    def _disconnect_player(self):
+        if not self._player_connected:
+            return
+        self.media_player.playbackStateChanged.disconnect(self.on_playback_state_changed)
+        self.media_player.positionChanged.disconnect(self.on_position_changed)
+        self.media_player.durationChanged.disconnect(self.on_duration_changed)
+        self._player_connected = False
 
     def browse_file(self):
         path, _ = QFileDialog.getSaveFileName(
@@ -178,44 +269,102 @@ class TTSTab(QWidget):
         voice = self.voice_combo.currentText()
         rate_str = self.rate_input.text().strip()
 
+        if engine == "edge":
+            # network bound, keep the event loop responsive while edge-tts streams
+            rate = f"+{rate_str}%" if not rate_str.startswith(("+", "-")) else f"{rate_str}%"
+            self.convert_btn.setEnabled(False)
+            fut = asyncio.run_coroutine_threadsafe(self.synth_edge_tts(text, voice, out_path, rate), self._loop)
+            fut.add_done_callback(partial(self._on_edge_tts_done, out_path))
+            return
+
+        # pyttsx3 drivers are bound to the thread that created them, so this one stays here
+        try:
+            self.synth_pyttsx3(text, voice, out_path, int(rate_str))
+            self.on_synth_finished(str(out_path))
+        except Exception as e:
+            self.on_synth_failed(str(e))
+
+    def _on_edge_tts_done(self, out_path, fut):
+        # runs on the event loop thread, the signals hop back to the UI thread
         try:
-            if engine == "edge":
-                rate = f"+{rate_str}%" if not rate_str.startswith(("+", "-")) else f"{rate_str}%"
-                asyncio.run(self.synth_edge_tts(text, voice, out_path, rate))
-            else:
-                self.synth_pyttsx3(text, voice, out_path, int(rate_str))
-            QMessageBox.information(self, "Success", f"Saved: {out_path}")
-            self.load_audio(str(out_path))
+            fut.result()
         except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
+            self.synth_failed.emit(str(e))
+        else:
+            self.synth_finished.emit(str(out_path))
+
+    def on_synth_finished(self, out_path):
+        self.convert_btn.setEnabled(True)
+        QMessageBox.information(self, "Success", f"Saved: {out_path}")
+        self.load_audio(out_path)
+
+    def on_synth_failed(self, error):
+        self.convert_btn.setEnabled(True)
+        QMessageBox.critical(self, "Error", error)
+
+    def _on_voices_done(self, fut):
+        # runs on the event loop thread; offline is fine, keep the built-in voices
+        if not fut.cancelled() and fut.exception() is None and fut.result():
+            self.voices_loaded.emit(fut.result())
+
+    def on_voices_loaded(self, voices):
+        current = self.voice_combo.currentText()
+        self.voice_combo.clear()
+        self.voice_combo.addItems(voices)
+        if current in voices:
+            self.voice_combo.setCurrentText(current)
 
     async def synth_edge_tts(self, text, voice_name, out_path, rate="+0%"):
         communicate = edge_tts.Communicate(text, voice_name, rate=rate)
-        audio_bytes = bytearray()
-        async for chunk in communicate.stream():
-            if chunk["type"] == "audio":
-                audio_bytes.extend(chunk["data"])
         if out_path.suffix.lower() == ".mp3":
-            out_path.write_bytes(bytes(audio_bytes))
+            await self._stream_to_file(communicate, out_path)
         else:
-            seg = AudioSegment.from_file(io.BytesIO(bytes(audio_bytes)), format="mp3")
-            seg.export(out_path, format=out_path.suffix.lstrip("."))
+            # edge-tts only produces mp3, let ffmpeg transcode straight from disk
+            with tempfile.TemporaryDirectory() as td:
+                tmp_mp3 = Path(td) / "tmp.mp3"
+                await self._stream_to_file(communicate, tmp_mp3)
+                # ffmpeg blocks, keep it off the shared loop so other edge-tts calls carry on
+                await asyncio.get_running_loop().run_in_executor(None, _transcode, tmp_mp3, out_path)
+
+    @staticmethod
+    async def _stream_to_file(communicate, path):
+        """Write audio chunks to disk as they arrive instead of buffering the whole clip.
+
+        The chunks go to a .part file next to path, which only replaces path once the stream
+        completes, so a failed synthesis leaves an existing file untouched.
+        """
+        part = path.with_name(path.name + ".part")
+        try:
+            with open(part, "wb") as f:
+                async for chunk in communicate.stream():
+                    if chunk["type"] == "audio":
+                        f.write(chunk["data"])
+            part.replace(path)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
 
     async def stream_edge_tts(self, text, voice_name, rate="+0%"):
-        self.audio_buffer = QBuffer()
-        self.audio_buffer.open(QBuffer.OpenModeFlag.ReadWrite)
+        # append into one pre-reserved array and hand it to the buffer once,
+        # QByteArray is implicitly shared so setData() doesn't copy it again
+        audio = QByteArray()
+        audio.reserve(1 << 20)
         communicate = edge_tts.Communicate(text, voice_name, rate=rate)
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
-                self.audio_buffer.write(chunk["data"])
-                self.audio_buffer.flush()
-        self.audio_buffer.seek(0)
+                audio.append(chunk["data"])
+        self.audio_buffer = QBuffer()
+        self.audio_buffer.setData(audio)
+        self.audio_buffer.open(QBuffer.OpenModeFlag.ReadOnly)
         self.media_player.setSourceDevice(self.audio_buffer)
         self.slider.setEnabled(True)
         self.media_player.play()
 
     def synth_pyttsx3(self, text, voice_id, out_path, rate):
-        engine = pyttsx3.init()
+        if self._pyttsx3 is None:
+            # driver init loads SAPI/NSSpeech and enumerates voices, only pay it once
+            self._pyttsx3 = pyttsx3.init()
+        engine = self._pyttsx3
         engine.setProperty("voice", voice_id)
         engine.setProperty("rate", int(rate))
         suffix = out_path.suffix.lower()
@@ -223,30 +372,28 @@ class TTSTab(QWidget):
             engine.save_to_file(text, str(out_path))
             engine.runAndWait()
         else:
-            with tempfile.TemporaryDirectory() as td:
-                tmp_wav = Path(td) / "tmp.wav"
-                engine.save_to_file(text, str(tmp_wav))
-                engine.runAndWait()
-                seg = AudioSegment.from_wav(tmp_wav)
-                seg.export(out_path, format=suffix.lstrip("."))
+            if self._tmp_dir is None:
+                self._tmp_dir = tempfile.TemporaryDirectory()
+                self._tmp_wav = Path(self._tmp_dir.name) / "tmp.wav"
+            engine.save_to_file(text, str(self._tmp_wav))
+            engine.runAndWait()
+            _transcode(self._tmp_wav, out_path)
 
     # ------------------------------
     # Modern YouTube-style Audio player logic
     # ------------------------------
 
-    def update_player_ui(self):
+    def on_position_changed(self, current_pos):
         """Update slider position and time label"""
-        if self.media_player.duration() > 0:
-            current_pos = self.media_player.position()
-            duration = self.media_player.duration()
-
-            # Update time label
-            self.time_label.setText(f"{format_time(current_pos)} / {format_time(duration)}")
+        # Leave the UI alone while stopped or while the user is dragging the slider
+        if not self.is_playing or self.slider.isSliderDown() or self._duration <= 0:
+            return
+        self.time_label.setText(f"{format_time(current_pos)} / {format_time(self._duration)}")
+        self.slider.setValue(int((current_pos / self._duration) * 1000))
 
-            # Update slider (only if user is not dragging it)
-            if not self.slider.isSliderDown():
-                progress = int((current_pos / duration) * 1000)
-                self.slider.setValue(progress)
+    def on_duration_changed(self, duration):
+        """Remember the duration so position updates don't have to query it"""
+        self._duration = duration
 
     def toggle_play_stop(self):
         """Toggle between play and stop states"""
@@ -257,18 +404,16 @@ class TTSTab(QWidget):
 
     def play_audio(self):
         """Start or resume playback"""
-        self.media_player.play()
-        self.timer.start(50)  # Update more frequently for smoother progress
         self.is_playing = True
+        self.media_player.play()
         self.play_stop_btn.setText("⏹")  # Stop icon
 
     def stop_audio(self):
         """Stop playback and reset to beginning"""
+        self.is_playing = False
         self.media_player.stop()
-        self.timer.stop()
         self.slider.setValue(0)
         self.time_label.setText("0:00 / 0:00")
-        self.is_playing = False
         self.play_stop_btn.setText("▶")  # Play icon
 
     def on_playback_state_changed(self, state):
@@ -276,28 +421,21 @@ class TTSTab(QWidget):
         if state == QMediaPlayer.PlaybackState.StoppedState:
             self.is_playing = False
             self.play_stop_btn.setText("▶")
-            self.timer.stop()
-
-    def on_slider_pressed(self):
-        """Pause updates while user is dragging the slider"""
-        self.timer.stop()
 
     def on_slider_released(self):
         """Seek to new position when user releases slider"""
         self.seek_audio(self.slider.value())
-        self.timer.start(50)
 
     def on_slider_moved(self, value):
         """Update time label while user is dragging slider"""
-        if self.media_player.duration() > 0:
-            current_time = int((value / 1000) * self.media_player.duration())
-            duration = self.media_player.duration()
-            self.time_label.setText(f"{format_time(current_time)} / {format_time(duration)}")
+        if self._duration > 0:
+            current_time = int((value / 1000) * self._duration)
+            self.time_label.setText(f"{format_time(current_time)} / {format_time(self._duration)}")
 
     def seek_audio(self, value):
         """Seek to specific position in audio"""
-        if self.media_player.duration() > 0:
-            new_pos = int((value / 1000) * self.media_player.duration())
+        if self._duration > 0:
+            new_pos = int((value / 1000) * self._duration)
             self.media_player.setPosition(new_pos)
 
     def load_audio(self, path):
@@ -1,45 +1,138 @@
 import threading
-import queue
-import math
 import os
+import queue
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QComboBox, QFileDialog, QMessageBox, QProgressBar, QTabWidget, QFrame
 )
-from PyQt6.QtCore import QTimer, Qt
+from PyQt6.QtCore import Qt, QStringListModel, pyqtSignal
 import yt_dlp as ytdlp
 
 import requests
-from PyQt6.QtGui import QPixmap
+from requests.adapters import HTTPAdapter
+from PyQt6.QtGui import QImage, QPixmap
 
 
 # ---------- Helper utils ----------
 
+# shared keep-alive pool for thumbnail fetches, saves a TLS handshake per check
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0))
+
+THUMB_MIN_WIDTH = 200  # the label is 150px wide, anything bigger is wasted bytes
+THUMB_MAX_BYTES = 256 * 1024
+THUMB_SIZE = (150, 84)  # thumbnail label size
+
+# metadata probe: only the format list is needed, skip every optional extractor request
+META_YDL_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "extract_flat": False,
+    "skip_download": True,
+    "noplaylist": True,
+    "writesubtitles": False,
+    "writeautomaticsub": False,
+    "getcomments": False,
+    "check_formats": False,
+    "postprocessors": [],
+}
+
+# extensions yt-dlp lists that aren't media (storyboard images)
+_BAD_EXTS = frozenset({"mhtml"})
+
+PROGRESS_INTERVAL = 0.1  # seconds between progress updates with an unchanged percentage
+
+# metadata YoutubeDL shared by every check, see shared_ydl()
+_YDL_LOCK = threading.Lock()
+_YDL = None
+
+META_CACHE_TTL = 300  # seconds a "Check Formats" result stays reusable
+# query parameters that don't change which video a URL points at
+_TRACKING_PARAMS = frozenset({"t", "si", "feature", "pp", "ab_channel"})
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def fmt_bytes(n):
     """Human readable bytes."""
     if n is None:
         return "Unknown"
     n = int(n)
-    if n == 0:
+    if n <= 0:
         return "0 B"
-    units = ["B", "KB", "MB", "GB", "TB"]
-    i = int(math.floor(math.log(n, 1024)))
-    p = math.pow(1024, i)
-    s = round(n / p, 2)
-    return f"{s} {units[i]}"
+    # every unit is 2**10 of the previous one, so the index falls out of the bit length
+    i = min((n.bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{n / (1 << (10 * i)):.2f} {_UNITS[i]}"
+
+
+@contextmanager
+def shared_ydl():
+    """The metadata YoutubeDL, built once so its extractors and regexes are reused across checks.
+
+    YoutubeDL isn't thread safe, so callers hold the lock for as long as they use it.
+    """
+    global _YDL
+    with _YDL_LOCK:
+        if _YDL is None:
+            _YDL = ytdlp.YoutubeDL(META_YDL_OPTS)
+        yield _YDL
+
+
+def normalize_url(url):
+    """Strip tracking/timestamp parameters so equivalent URLs share a cache entry."""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k not in _TRACKING_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def pick_thumbnail(info):
+    """Smallest thumbnail that is still wide enough, instead of the maxres default."""
+    candidates = [
+        t for t in info.get("thumbnails") or []
+        if t.get("url") and (t.get("width") or 0) >= THUMB_MIN_WIDTH
+    ]
+    if candidates:
+        return min(candidates, key=lambda t: t["width"])["url"]
+    return info.get("thumbnail")
+
+
+def fetch_thumbnail(url):
+    """Download thumbnail bytes, giving up on anything larger than THUMB_MAX_BYTES."""
+    # small JPEGs don't compress, skip the gzip round trip
+    with _SESSION.get(url, timeout=6, stream=True, headers={"Accept-Encoding": "identity"}) as r:
+        if r.status_code != 200:
+            return None
+        chunks = []
+        size = 0
+        for chunk in r.iter_content(chunk_size=65536):
+            size += len(chunk)
+            if size > THUMB_MAX_BYTES:
+                return None
+            chunks.append(chunk)
+    return b"".join(chunks) or None
 
 
 # ---------- Worker thread ----------
 
 class YTDLWorker(threading.Thread):
-    def __init__(self, url, format_id, out_template, progress_queue):
+    def __init__(self, url, format_id, out_template, progress_signal):
         super().__init__(daemon=True)
         self.url = url
         self.format_id = format_id
         self.out_template = out_template
-        self.progress_queue = progress_queue
+        self.progress_signal = progress_signal
+        # throttle state for _progress_hook
+        self._last_emit = 0.0
+        self._last_percent = -1
+        # latest progress not yet shown; at most one "progress" message is in flight at a time
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
 
     def run(self):
         ydl_opts = {
@@ -49,9 +142,17 @@ class YTDLWorker(threading.Thread):
             "progress_hooks": [self._progress_hook],
             "quiet": True,
             "no_warnings": True,
-            "merge_output_format": "mp4",  # For merging video+audio
+            # several fragments in flight, and range requests small enough to dodge YouTube's throttling
+            "concurrent_fragment_downloads": 4,
+            "http_chunk_size": 10 * 1024 * 1024,
+            # start reading/writing in 64 KiB blocks instead of yt-dlp's 1 KiB default
+            "buffersize": 64 * 1024,
         }
 
+        # Only a video+audio selection needs muxing, anything else is saved as-is without an ffmpeg pass
+        if "+" in self.format_id:
+            ydl_opts["merge_output_format"] = "mp4"
+
         # If it's an audio-only format, set postprocessor for audio extraction
         if self.format_id == "bestaudio" or self.format_id.startswith("bestaudio/"):
             ydl_opts["postprocessors"] = [{
@@ -61,14 +162,14 @@ class YTDLWorker(threading.Thread):
 
         try:
             with ytdlp.YoutubeDL(ydl_opts) as ydl:
-                self.progress_queue.put(("status", "Fetching info..."))
+                self.progress_signal.emit("status", "Fetching info...")
                 info = ydl.extract_info(self.url, download=False)
                 title = info.get("title", "video")
-                self.progress_queue.put(("status", f"Downloading: {title}"))
+                self.progress_signal.emit("status", f"Downloading: {title}")
                 ydl.download([self.url])
-                self.progress_queue.put(("done", f"Finished: {title}"))
+                self.progress_signal.emit("done", f"Finished: {title}")
         except Exception as e:
-            self.progress_queue.put(("error", str(e)))
+            self.progress_signal.emit("error", str(e))
 
     def _progress_hook(self, d):
         try:
@@ -79,6 +180,12 @@ class YTDLWorker(threading.Thread):
                 speed = d.get("speed")
                 eta = d.get("eta")
                 percent = int(downloaded * 100 / total) if total else 0
+                # yt-dlp calls this per chunk, cap UI updates at ~10/s unless the percentage moved
+                now = time.monotonic()
+                if now - self._last_emit < PROGRESS_INTERVAL and percent == self._last_percent:
+                    return
+                self._last_emit = now
+                self._last_percent = percent
                 msg = {
                     "percent": percent,
                     "downloaded": downloaded,
@@ -86,29 +193,50 @@ class YTDLWorker(threading.Thread):
                     "speed": speed,
                     "eta": eta,
                 }
-                self.progress_queue.put(("progress", msg))
+                with self._progress_lock:
+                    in_flight = self._pending_progress is not None
+                    self._pending_progress = msg
+                if not in_flight:
+                    # the UI picks up whatever is newest when it gets to this message
+                    self.progress_signal.emit("progress", self)
             elif status == "finished":
-                self.progress_queue.put(("status", "Postprocessing..."))
+                self.progress_signal.emit("status", "Postprocessing...")
         except Exception as e:
-            self.progress_queue.put(("error", f"Progress hook error: {e}"))
+            self.progress_signal.emit("error", f"Progress hook error: {e}")
+
+    def take_progress(self):
+        """Latest progress dict since the last call, or None. Called from the UI thread."""
+        with self._progress_lock:
+            msg, self._pending_progress = self._pending_progress, None
+        return msg
 
 
 # ---------- Main Tab ----------
 
 class YouTubeTab(QWidget):
+    # (type, data) messages from the worker threads, delivered on the UI thread
+    worker_message = pyqtSignal(str, object)
+
     def __init__(self):
         super().__init__()
-        self.progress_queue = queue.Queue()
         self.worker = None
-        self.formats = []
         self.info = None
+        # output folder resolved once per edit, created before the first download into it
+        self._outdir_resolved = Path()
+        self._outdir_created = False
+        # normalized URL -> (time.monotonic() of fetch, formats_ready payload)
+        self._meta_cache = {}
+        # one long-lived daemon thread runs the metadata checks, extractor caches stay warm
+        # between checks and it never holds up closing the window
+        self._meta_jobs = queue.Queue()
+        threading.Thread(target=self._run_meta_jobs, name="yt-meta", daemon=True).start()
+        # bumped per check, a fetch only reports back if it is still the latest one
+        self._check_seq = 0
 
         self.init_ui()
 
-        # periodic queue processing
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._process_queue)
-        self.timer.start(200)
+        # queued even when emitted from the UI thread, so handlers never run re-entrantly
+        self.worker_message.connect(self._handle_message, Qt.ConnectionType.QueuedConnection)
 
     def init_ui(self):
         layout = QVBoxLayout()
@@ -134,7 +262,7 @@ class YouTubeTab(QWidget):
         # --- Thumbnail + Title ---
         thumb_row = QHBoxLayout()
         self.thumbnail_label = QLabel()
-        self.thumbnail_label.setFixedSize(150, 84)
+        self.thumbnail_label.setFixedSize(*THUMB_SIZE)
         self.thumbnail_label.setStyleSheet("border: 1px solid #444; border-radius: 6px; background: #111;")
         self.thumbnail_label.setScaledContents(True)
         thumb_row.addWidget(self.thumbnail_label)
@@ -190,6 +318,7 @@ class YouTubeTab(QWidget):
         out_row = QHBoxLayout()
         out_row.addWidget(QLabel("💾 Save to:"))
         self.outdir_input = QLineEdit()
+        self.outdir_input.textChanged.connect(self._on_outdir_changed)
         browse_btn = QPushButton("Browse")
         browse_btn.clicked.connect(self.browse_folder)
         out_row.addWidget(self.outdir_input)
@@ -231,6 +360,10 @@ class YouTubeTab(QWidget):
         if path:
             self.outdir_input.setText(path)
 
+    def _on_outdir_changed(self, text):
+        self._outdir_resolved = Path(text).expanduser()
+        self._outdir_created = False
+
     def open_folder(self):
         try:
             path = Path(self.outdir_input.text())
@@ -250,153 +383,175 @@ class YouTubeTab(QWidget):
             QMessageBox.warning(self, "Error", "Please enter a YouTube URL.")
             return
 
+        # the button stays enabled, clicking again supersedes a check that is still running
         self.status_label.setText("Fetching formats...")
-        self.check_btn.setEnabled(False)
         self.download_btn.setEnabled(False)
         # clear combos but keep tabs (we will fill them when ready)
         self.video_combo.clear()
         self.audio_combo.clear()
         self.all_combo.clear()
-        self.formats = []
+
+        self._check_seq += 1
+        seq = self._check_seq
+
+        cache_key = normalize_url(url)
+        cached = self._meta_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < META_CACHE_TTL:
+            # checked moments ago, skip the round trips to YouTube
+            self.worker_message.emit("formats_ready", cached[1])
+            self.worker_message.emit("check_done", None)
+            return
 
         def _fetch():
+            if seq != self._check_seq:
+                return  # superseded while waiting in the queue
             try:
-                ydl_opts = {"quiet": True, "no_warnings": True, "extract_flat": False}
-                with ytdlp.YoutubeDL(ydl_opts) as ydl:
+                with shared_ydl() as ydl:
                     info = ydl.extract_info(url, download=False)
-                    raw_formats = info.get("formats", [])
-
-                    fmts = []
-                    # combined "best" entry
-                    fmts.append({
-                        "id": "bestvideo+bestaudio/best",
-                        "label": "Best available (auto merge)",
-                        "ext": "mp4",
-                        "vcodec": "auto",
-                        "acodec": "auto",
-                        "filesize": 0,
-                        "height": None,
+
+                raw_formats = info.get("formats", [])
+
+                # classified here, off the UI thread, in the same pass that builds the labels
+                video_formats = []
+                audio_formats = []
+                all_formats = []
+                # combined "best" entry
+                all_formats.append({
+                    "id": "bestvideo+bestaudio/best",
+                    "label": "Best available (auto merge)",
+                    "ext": "mp4",
+                    "vcodec": "auto",
+                    "acodec": "auto",
+                    "filesize": 0,
+                    "height": None,
+                })
+
+                for f in raw_formats:
+                    fmt_id = f.get("format_id", "") or f.get("id", "")
+                    # only a handful of distinct ext/codec/note values repeat across every format,
+                    # interning lets all the format dicts share one copy of each
+                    ext = sys.intern(f.get("ext", "") or "")
+                    # skip MHTML and other non-media hunks
+                    if not ext or ext.lower() in _BAD_EXTS:
+                        continue
+                    height = f.get("height")  # None for audio or unknown
+                    acodec = sys.intern(f.get("acodec", "") or "")
+                    vcodec = sys.intern(f.get("vcodec", "") or "")
+                    filesize = f.get("filesize") or f.get("filesize_approx") or 0
+                    format_note = sys.intern(f.get("format_note", "") or "")
+
+                    # skip totally useless
+                    if not acodec and not vcodec:
+                        continue
+
+                    # resolution string
+                    if height:
+                        res = f"{height}p"
+                    elif vcodec == "none" and acodec and acodec != "none":
+                        res = "audio"
+                    else:
+                        # some formats may have e.g. "DASH audio" as note
+                        res = format_note or "unknown"
+
+                    if vcodec and vcodec != "none" and (not acodec or acodec == "none"):
+                        kind = "(video only)"
+                        bucket = video_formats
+                    elif acodec and acodec != "none" and (not vcodec or vcodec == "none"):
+                        kind = "(audio only)"
+                        bucket = audio_formats
+                    else:
+                        kind = ""
+                        bucket = all_formats
+
+                    label = " — ".join(filter(None, (res, ext, fmt_bytes(filesize), kind)))
+                    bucket.append({
+                        "id": str(fmt_id),
+                        "label": label,
+                        "ext": ext,
+                        "vcodec": vcodec,
+                        "acodec": acodec,
+                        "filesize": filesize,
+                        "height": height
                     })
 
-                    for f in raw_formats:
-                        fmt_id = f.get("format_id", "") or f.get("id", "")
-                        ext = f.get("ext", "") or ""
-                        # skip MHTML and other non-media hunks
-                        if not ext or "mhtml" in ext.lower():
-                            continue
-                        height = f.get("height")  # None for audio or unknown
-                        acodec = f.get("acodec", "") or ""
-                        vcodec = f.get("vcodec", "") or ""
-                        filesize = f.get("filesize") or f.get("filesize_approx") or 0
-                        format_note = f.get("format_note", "")
-
-                        # skip totally useless
-                        if not acodec and not vcodec:
-                            continue
-
-                        # resolution string
-                        if height:
-                            res = f"{height}p"
-                        elif vcodec == "none" and acodec and acodec != "none":
-                            res = "audio"
-                        else:
-                            # some formats may have e.g. "DASH audio" as note
-                            res = format_note or "unknown"
-
-                        label_parts = [res, ext, fmt_bytes(filesize)]
-                        if vcodec and vcodec != "none" and (not acodec or acodec == "none"):
-                            label_parts.append("(video only)")
-                        elif acodec and acodec != "none" and (not vcodec or vcodec == "none"):
-                            label_parts.append("(audio only)")
-
-                        label = " — ".join([str(p) for p in label_parts if p])
-                        fmts.append({
-                            "id": str(fmt_id),
-                            "label": label,
-                            "ext": ext,
-                            "vcodec": vcodec,
-                            "acodec": acodec,
-                            "filesize": filesize,
-                            "height": height
-                        })
-
-                    # try download thumbnail bytes (best-effort)
-                    thumbnail_bytes = None
-                    thumb_url = info.get("thumbnail")
-                    if thumb_url:
-                        try:
-                            r = requests.get(thumb_url, timeout=6)
-                            if r.status_code == 200 and r.content:
-                                thumbnail_bytes = r.content
-                        except Exception:
-                            thumbnail_bytes = None
-
-                    # send a plain payload (no Qt objects) back to main thread
-                    self.progress_queue.put(
-                        ("formats_ready", {"formats": fmts, "info": info, "thumbnail": thumbnail_bytes}))
+                # try download thumbnail (best-effort), decoded and scaled here rather than
+                # on the UI thread; QImage is safe to use off the GUI thread, QPixmap isn't
+                thumbnail = None
+                thumb_url = pick_thumbnail(info)
+                if thumb_url:
+                    try:
+                        thumb_bytes = fetch_thumbnail(thumb_url)
+                        if thumb_bytes:
+                            img = QImage.fromData(thumb_bytes)
+                            if not img.isNull():
+                                thumbnail = img.scaled(*THUMB_SIZE, Qt.AspectRatioMode.KeepAspectRatio,
+                                                       Qt.TransformationMode.SmoothTransformation)
+                    except Exception:
+                        thumbnail = None
+
+                # send the payload back to main thread (the only Qt object is the QImage)
+                payload = {
+                    "video": video_formats,
+                    "audio": audio_formats,
+                    "all": all_formats,
+                    "video_labels": [f["label"] for f in video_formats],
+                    "audio_labels": [f["label"] for f in audio_formats],
+                    "all_labels": [f["label"] for f in all_formats],
+                    "info": info,
+                    "thumbnail": thumbnail,
+                }
+                self._store_meta(cache_key, payload)
+                if seq == self._check_seq:
+                    self.worker_message.emit("formats_ready", payload)
             except Exception as e:
-                self.progress_queue.put(("error", f"Failed to fetch formats: {e}"))
+                if seq == self._check_seq:
+                    self.worker_message.emit("error", f"Failed to fetch formats: {e}")
             finally:
-                self.progress_queue.put(("check_done", None))
+                if seq == self._check_seq:
+                    self.worker_message.emit("check_done", None)
 
-        threading.Thread(target=_fetch, daemon=True).start()
+        self._meta_jobs.put(_fetch)
 
-    def _on_formats_ready(self):
-        if not self.formats:
-            QMessageBox.information(self, "Info", "No formats found.")
-            return
+    def _run_meta_jobs(self):
+        while True:
+            self._meta_jobs.get()()
 
-        # Clear combos
-        self.video_combo.clear()
-        self.audio_combo.clear()
-        self.all_combo.clear()
+    def _store_meta(self, key, payload):
+        now = time.monotonic()
+        # drop expired entries so the cache can't grow without bound
+        for k in [k for k, (ts, _) in self._meta_cache.items() if now - ts >= META_CACHE_TTL]:
+            del self._meta_cache[k]
+        self._meta_cache[key] = (now, payload)
 
-        video_formats = []
-        audio_formats = []
-        all_formats = []
-
-        for f in self.formats:
-            ext = f.get("ext")
-            if not ext or "mhtml" in ext.lower():
-                continue  # skip unwanted formats
-
-            vcodec = f.get("vcodec", "") or ""
-            acodec = f.get("acodec", "") or ""
-
-            # classify
-            if vcodec and vcodec != "none" and (not acodec or acodec == "none"):
-                video_formats.append(f)
-            elif acodec and acodec != "none" and (not vcodec or vcodec == "none"):
-                audio_formats.append(f)
-            else:
-                all_formats.append(f)
+    def _on_formats_ready(self, data):
+        if not (data["video"] or data["audio"] or data["all"]):
+            QMessageBox.information(self, "Info", "No formats found.")
+            return
 
-        # Populate combos (store the index mapping via saved lists)
+        # Populate combos (the worker already classified the formats and built the labels)
         # The displayed label already includes resolution, ext, size
-        for f in video_formats:
-            self.video_combo.addItem(f["label"])
-        for f in audio_formats:
-            self.audio_combo.addItem(f["label"])
-        for f in all_formats:
-            self.all_combo.addItem(f["label"])
+        combos = (self.video_combo, self.audio_combo, self.all_combo)
+        for c in combos:
+            c.blockSignals(True)
+            c.setUpdatesEnabled(False)
+        try:
+            for c, key in zip(combos, ("video_labels", "audio_labels", "all_labels")):
+                # one prebuilt model instead of growing the default one row by row,
+                # parented to the combo so the next setModel() frees it
+                c.setModel(QStringListModel(data[key], c))
+        finally:
+            for c in combos:
+                c.setUpdatesEnabled(True)
+                c.blockSignals(False)
 
         # Save classified formats for later download lookup
-        self.video_formats = video_formats
-        self.audio_formats = audio_formats
-        self.all_formats = all_formats
+        self.video_formats = data["video"]
+        self.audio_formats = data["audio"]
+        self.all_formats = data["all"]
 
-        # show thumbnail if provided in info payload (self.info will contain it)
-        # worker attached bytes into self.info payload earlier; the queue handler should set self.info and self._thumbnail_bytes
-        if hasattr(self, "_thumbnail_bytes") and self._thumbnail_bytes:
-            try:
-                pix = QPixmap()
-                pix.loadFromData(self._thumbnail_bytes)
-                self.thumbnail_label.setPixmap(
-                    pix.scaled(self.thumbnail_label.size(), Qt.AspectRatioMode.KeepAspectRatio,
-                               Qt.TransformationMode.SmoothTransformation))
-            except Exception:
-                # ignore thumbnail errors
-                pass
+        # show thumbnail if provided in the payload, already decoded and scaled by the worker
+        if getattr(self, "_thumbnail", None) is not None:
+            self.thumbnail_label.setPixmap(QPixmap.fromImage(self._thumbnail))
         else:
             self.thumbnail_label.clear()
 
@@ -440,13 +595,15 @@ class YouTubeTab(QWidget):
         fmt = formats_list[sel_idx]
         fmt_id = fmt.get("id") or "bestvideo+bestaudio/best"
 
-        outdir = Path(self.outdir_input.text()).expanduser()
-        outdir.mkdir(parents=True, exist_ok=True)
+        outdir = self._outdir_resolved
+        if not self._outdir_created:
+            outdir.mkdir(parents=True, exist_ok=True)
+            self._outdir_created = True
 
         # allow user template like {title}.{ext}
         filename_template = self.filename_input.text().strip() or "{title}.{ext}"
         out_template = filename_template.replace("{title}", "%(title)s").replace("{ext}", "%(ext)s")
-        out_template = str(outdir / out_template)
+        out_template = os.path.join(os.fspath(outdir), out_template)
 
         self.download_btn.setEnabled(False)
         self.check_btn.setEnabled(False)
@@ -457,43 +614,40 @@ class YouTubeTab(QWidget):
             url=self.url_input.text().strip(),
             format_id=fmt_id,
             out_template=out_template,
-            progress_queue=self.progress_queue
+            progress_signal=self.worker_message
         )
         self.worker.start()
 
-    def _process_queue(self):
-        try:
-            while True:
-                typ, data = self.progress_queue.get_nowait()
-                if typ == "formats_ready":
-                    # data contains 'formats', 'info', 'thumbnail'
-                    self.formats = data.get("formats", [])
-                    self.info = data.get("info")
-                    # keep thumbnail bytes on the instance so _on_formats_ready can use it
-                    self._thumbnail_bytes = data.get("thumbnail")
-                    self._on_formats_ready()
-                elif typ == "check_done":
-                    self.check_btn.setEnabled(True)
-                elif typ == "progress":
-                    msg = data
-                    percent = msg.get("percent", 0)
-                    self.progress_bar.setValue(percent)
-                    downloaded = fmt_bytes(msg.get("downloaded"))
-                    total = fmt_bytes(msg.get("total"))
-                    eta = msg.get("eta")
-                    self.status_label.setText(f"Downloading {percent}% — {downloaded}/{total} — ETA: {eta}s")
-                elif typ == "status":
-                    self.status_label.setText(str(data))
-                elif typ == "done":
-                    self.status_label.setText(str(data))
-                    self.progress_bar.setValue(100)
-                    self.download_btn.setEnabled(True)
-                    self.check_btn.setEnabled(True)
-                    QMessageBox.information(self, "Done", str(data))
-                elif typ == "error":
-                    self.status_label.setText("Error")
-                    self.download_btn.setEnabled(True)
-                    self.check_btn.setEnabled(True)
-                    QMessageBox.critical(self, "Error", str(data))
-        except queue.Empty:
-            pass
+    def _handle_message(self, typ, data):
+        if typ == "formats_ready":
+            # data contains the 'video'/'audio'/'all' formats and labels, 'info', 'thumbnail'
+            self.info = data.get("info")
+            # keep the thumbnail QImage on the instance so _on_formats_ready can use it
+            self._thumbnail = data.get("thumbnail")
+            self._on_formats_ready(data)
+        elif typ == "check_done":
+            self.check_btn.setEnabled(True)
+        elif typ == "progress":
+            # data is the worker; stale updates were coalesced, only the newest is drawn
+            msg = data.take_progress()
+            if msg is None:
+                return
+            percent = msg.get("percent", 0)
+            self.progress_bar.setValue(percent)
+            downloaded = fmt_bytes(msg.get("downloaded"))
+            total = fmt_bytes(msg.get("total"))
+            eta = msg.get("eta")
+            self.status_label.setText(f"Downloading {percent}% — {downloaded}/{total} — ETA: {eta}s")
+        elif typ == "status":
+            self.status_label.setText(str(data))
+        elif typ == "done":
+            self.status_label.setText(str(data))
+            self.progress_bar.setValue(100)
+            self.download_btn.setEnabled(True)
+            self.check_btn.setEnabled(True)
+            QMessageBox.information(self, "Done", str(data))
+        elif typ == "error":
+            self.status_label.setText("Error")
+            self.download_btn.setEnabled(True)
+            self.check_btn.setEnabled(True)
+            QMessageBox.critical(self, "Error", str(data))